@@ -1,10 +1,18 @@
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
 
-from sensor_fusion_exercise.object_recognition import IdentifiedObject, MockObjectRecognition
+from sensor_fusion_exercise.object_recognition import IdentifiedObject, MockObjectRecognition, locations_to_soa
 from sensor_fusion_exercise.sensor import Frame, Sensor
-from sensor_fusion_exercise.utils import SensorId
+from sensor_fusion_exercise.utils import SensorId, north_east_arrays
+
+# Below this number of sensors the overhead of dispatching to an executor outweighs the parallel processing
+MIN_SENSORS_FOR_EXECUTOR = 3
 
 
 class FusionStation:
@@ -12,6 +20,9 @@ class FusionStation:
     Central fusion station which gets frames from a sensor array at each tick, processes them using an
     object recognition algorithm and fuses localized objects from each camera into a single common representation
     visualised in a common operational picture.
+
+    Sensors are independent of each other until fusion, hence an optional thread pool `executor` can run the object
+    recognition of each sensor in parallel. Frames are always fetched in the calling thread so sensors advance in order.
     """
 
     def __init__(
@@ -19,22 +30,43 @@ class FusionStation:
         sensor_array: list[Sensor[Frame]],
         object_recognition: MockObjectRecognition,
         match_and_fuse_identified_objects: Callable[[dict[SensorId, list[IdentifiedObject]]], list[IdentifiedObject]],
+        executor: ThreadPoolExecutor | None = None,
     ) -> None:
         self._sensor_array = sensor_array
         self._object_recognition = object_recognition
         self._match_and_fuse_identified_objects = match_and_fuse_identified_objects
+        self._executor = executor
+        self._figures: dict[str, tuple[Figure, Axes]] = {}
 
     def _next_tick(self) -> dict[SensorId, list[IdentifiedObject]]:
         """
         Advances a tick: gets frames from a sensor array and processes them using an
         object recognition algorithm. Returns a mapping of sensors to object identifications.
         """
-        sensor_object_mapping = dict()
-        for sensor in self._sensor_array:
-            frame = sensor.next_tick()
-            identified_objects = self._object_recognition.identify_and_localise(frame, sensor)
-            sensor_object_mapping[sensor.sensor_id] = identified_objects
-        return sensor_object_mapping
+        sensor_frames = [(sensor, sensor.next_tick()) for sensor in self._sensor_array]
+        if self._executor is None or len(self._sensor_array) < MIN_SENSORS_FOR_EXECUTOR:
+            return {
+                sensor.sensor_id: self._object_recognition.identify_and_localise(frame, sensor)
+                for sensor, frame in sensor_frames
+            }
+
+        futures = {
+            sensor.sensor_id: self._executor.submit(self._object_recognition.identify_and_localise, frame, sensor)
+            for sensor, frame in sensor_frames
+        }
+        return {sensor_id: future.result() for sensor_id, future in futures.items()}
+
+    def _operational_picture_axes(self, figure_key: str) -> Axes:
+        """
+        Returns cleared axes of the operational picture for `figure_key`, reusing its figure as long as it is
+        still open. Separate keys keep e.g. the not fused and fused pictures side by side.
+        """
+        figure_and_ax = self._figures.get(figure_key)
+        if figure_and_ax is None or not plt.fignum_exists(figure_and_ax[0].number):
+            figure_and_ax = self._figures[figure_key] = plt.subplots()
+        else:
+            figure_and_ax[1].cla()
+        return figure_and_ax[1]
 
     def execute_without_fusion(self) -> dict[SensorId, list[IdentifiedObject]]:
         """Advances the `_next_tick` and visualises the not fused object identifications."""
@@ -44,40 +76,46 @@ class FusionStation:
             for per_sensor_identified_objects in sensor_object_mapping.values()
             for per_sensor_identified_object in per_sensor_identified_objects
         ]
-        self.visualise_operational_picture(not_fused_objects)
+        self.visualise_operational_picture(not_fused_objects, figure_key="not_fused")
         return sensor_object_mapping
 
     def execute_with_fusion(self) -> None:
         """Advances the `_next_tick`, fuses identifications and visualises the fused representation."""
         sensor_object_mapping = self._next_tick()
         fused_objects = self._match_and_fuse_identified_objects(sensor_object_mapping)
-        self.visualise_operational_picture(fused_objects)
+        self.visualise_operational_picture(fused_objects, figure_key="fused")
 
-    def visualise_operational_picture(self, fused_objects: list[IdentifiedObject]) -> None:
+    def visualise_operational_picture(
+        self, fused_objects: list[IdentifiedObject], figure_key: str = "operational_picture"
+    ) -> None:
         # Sensor locations
-        north_sensors = [sensor.location_north_east.north for sensor in self._sensor_array]
-        east_sensors = [sensor.location_north_east.east for sensor in self._sensor_array]
-        marker_sensors = ["g"] * len(self._sensor_array)
+        num_sensors = len(self._sensor_array)
+        north_sensors, east_sensors = north_east_arrays([sensor.location_north_east for sensor in self._sensor_array])
         annotation_sensors = [f"Camera {sensor.sensor_id}" for sensor in self._sensor_array]
 
         # Localised objects
-        north_objects = [fused.object_location_north_east.north for fused in fused_objects]
-        east_objects = [fused.object_location_north_east.east for fused in fused_objects]
-        marker_objects = ["r"] * len(fused_objects)
+        north_objects, east_objects = locations_to_soa(fused_objects)
         annotation_objects = [fused.class_name for fused in fused_objects]
 
-        # Combined
-        combined_east = east_sensors + east_objects
-        combined_north = north_sensors + north_objects
-
-        fig, ax = plt.subplots()
-        ax.scatter(combined_east, combined_north, s=100.0, c=marker_sensors + marker_objects)
-        for i, txt in enumerate(annotation_sensors + annotation_objects):
-            ax.annotate(txt, (combined_east[i], combined_north[i]))
-        ax.set_ylabel("North [meters]")
-        ax.set_xlabel("East [meters]")
-        ax.set_xlim(-5.0, 80.0)
-        ax.set_ylim(-5.0, 160.0)
-        ax.grid()
+        # Combined, with sensors in green and objects in red
+        combined_east = np.concatenate((east_sensors, east_objects))
+        combined_north = np.concatenate((north_sensors, north_objects))
+        combined_colors = np.repeat([to_rgb("g"), to_rgb("r")], [num_sensors, len(fused_objects)], axis=0)
+
+        # Defer redraws until all artists are added
+        with plt.ioff():
+            ax = self._operational_picture_axes(figure_key)
+            ax.scatter(combined_east, combined_north, s=100.0, c=combined_colors)
+            for txt, position in zip(
+                annotation_sensors + annotation_objects,
+                zip(combined_east.tolist(), combined_north.tolist()),
+                strict=True,
+            ):
+                ax.annotate(txt, position)
+            ax.set_ylabel("North [meters]")
+            ax.set_xlabel("East [meters]")
+            ax.set_xlim(-5.0, 80.0)
+            ax.set_ylim(-5.0, 160.0)
+            ax.grid()
 
         plt.show()
@@ -1,13 +1,19 @@
 import logging
 import math
+from functools import lru_cache
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment  # type: ignore[import-untyped]
 
 from sensor_fusion_exercise.fusion_station import FusionStation
-from sensor_fusion_exercise.object_recognition import BoundingBox, IdentifiedObject, MockObjectRecognition
+from sensor_fusion_exercise.object_recognition import (
+    BoundingBox,
+    IdentifiedObject,
+    MockObjectRecognition,
+    locations_to_soa,
+)
 from sensor_fusion_exercise.sensor import CameraConfig, Frame, MockCamera, Sensor
-from sensor_fusion_exercise.utils import OBJECT_PRIORS_WIDTH, LocationNE, Meters, SensorId
+from sensor_fusion_exercise.utils import OBJECT_PRIORS_WIDTH, Degrees, LocationNE, Meters, Pixels, SensorId
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,11 @@ def monocular_distance_from_object_prior(identified_object: IdentifiedObject, fr
     pass
 
 
+def distance_metric(object1: IdentifiedObject, object2: IdentifiedObject) -> Meters:
+    """Calculates the distance between the locations of two identified objects in meters."""
+    pass
+
+
 def match_and_fuse_identified_objects(
     sensor_object_mapping: dict[SensorId, list[IdentifiedObject]],
 ) -> list[IdentifiedObject]:
@@ -29,10 +40,6 @@ def match_and_fuse_identified_objects(
     Based on the distance metrics, one can find an optimal assignment between object pairs to
     output a list of fused identified objects.
     """
-
-    def distance_metric(object1: IdentifiedObject, object2: IdentifiedObject) -> Meters:
-        pass
-
     pass
 
 
@@ -1,13 +1,14 @@
+import math
 from collections.abc import Callable
 from dataclasses import dataclass
 
-import numpy as np
+from nptyping import Float, NDArray, Shape
 
 from sensor_fusion_exercise.sensor import Frame, Sensor
-from sensor_fusion_exercise.utils import LocationNE, Meters, Pixels, SensorId
+from sensor_fusion_exercise.utils import LocationNE, Meters, Pixels, SensorId, north_east_arrays
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     x: Pixels
     y: Pixels
@@ -15,13 +16,23 @@ class BoundingBox:
     height: Pixels
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentifiedObject:
     bounding_box: BoundingBox
     class_name: str  # object class
     object_location_north_east: LocationNE
 
 
+def locations_to_soa(
+    identified_objects: list[IdentifiedObject],
+) -> tuple[NDArray[Shape["N"], Float], NDArray[Shape["N"], Float]]:
+    """
+    Converts the north-east locations of identified objects into a structure of arrays,
+    i.e. one array of north and one of east coordinates.
+    """
+    return north_east_arrays([identified_object.object_location_north_east for identified_object in identified_objects])
+
+
 class MockObjectRecognition:
     """
     Mocked object recognition algorithm using provided ground truth detections with classes and bounding boxes.
@@ -52,8 +63,9 @@ class MockObjectRecognition:
 
         # Convert polar coordinates to cartesian coordinates
         combined_bearing = sensor.bearing + delta_from_sensor_bearing
-        north_wrt_sensor = object_distance_wrt_sensor * np.cos(np.deg2rad(combined_bearing))
-        east_wrt_sensor = object_distance_wrt_sensor * np.sin(np.deg2rad(combined_bearing))
+        combined_bearing_rad = math.radians(combined_bearing)
+        north_wrt_sensor = object_distance_wrt_sensor * math.cos(combined_bearing_rad)
+        east_wrt_sensor = object_distance_wrt_sensor * math.sin(combined_bearing_rad)
         # Add sensor location to get the location in the global coordinate system
         return LocationNE(
             north=north_wrt_sensor + sensor.location_north_east.north,
@@ -79,7 +79,8 @@ class MockCamera(Sensor[Frame]):
         self._sensor_id = sensor_id
 
     def next_tick(self) -> Frame:
-        image = np.zeros((self._config.image_height, self._config.image_width, 3), dtype=np.float32)
+        # Mocked image content is never read, hence a read-only zero-copy view avoids allocating a full frame per tick
+        image = np.broadcast_to(np.float32(0.0), (self._config.image_height, self._config.image_width, 3))
         return Frame(image=image, fov_horizontal=self._config.fov_horizontal, fov_vertical=self._config.fov_vertical)
 
     @property
@@ -2,17 +2,88 @@
 
 #%%
 # Example solution monocular distance estimation
+# @lru_cache(maxsize=1024)
+# def _monocular_distance(class_name: str, bbox_width: Pixels, fov_horizontal: Degrees, image_width: Pixels) -> Meters:
+#     bbox_width_degree = bbox_width / image_width * fov_horizontal
+#     return Meters(OBJECT_PRIORS_WIDTH[class_name] / (2.0 * math.tan(math.radians(bbox_width_degree) / 2.0)))
+#
+#
 # def monocular_distance_from_object_prior(identified_object: IdentifiedObject, frame: Frame) -> Meters:
 #     """
 #     Calculates the distance based on an object size prior and the respective bounding box size.
 #     Returns a distance estimate from the camera to the target object in meters.
+#     The estimate only depends on hashable scalars, hence it is cached across ticks.
 #     """
 #     image_width = frame.image.shape[1]  # Retrieve width pixels dimension from image in the format H x W x C
-#     bbox_width_degree = identified_object.bounding_box.width / image_width * frame.fov_horizontal
-#     distance = Meters(
-#         OBJECT_PRIORS_WIDTH[identified_object.class_name] / (2.0 * np.tan(np.deg2rad(bbox_width_degree) / 2.0))
+#     return _monocular_distance(
+#         identified_object.class_name, identified_object.bounding_box.width, frame.fov_horizontal, image_width
 #     )
-#     return distance
+
+# Example solution distance metric
+# def distance_metric(object1: IdentifiedObject, object2: IdentifiedObject) -> Meters:
+#     """Calculates the distance between the locations of two identified objects in meters."""
+#     # Euclidian distance: sqrt((x_2 - x_1)^2 + (y_2 - y_1)^2)
+#     location1 = object1.object_location_north_east
+#     location2 = object2.object_location_north_east
+#     return Meters(math.hypot(location2.north - location1.north, location2.east - location1.east))
+
+# Example solution pairwise cost kernel
+# try:
+#     from numba import njit, prange
+#
+#     USE_NUMBA = True
+# except ImportError:
+#     USE_NUMBA = False
+#     prange = range
+#
+#
+# def _pairwise_cost_numpy(
+#     north_1: np.ndarray, east_1: np.ndarray, north_2: np.ndarray, east_2: np.ndarray, out: np.ndarray
+# ) -> None:
+#     np.sqrt((north_1[:, None] - north_2[None, :]) ** 2 + (east_1[:, None] - east_2[None, :]) ** 2, out=out)
+#
+#
+# def _pairwise_cost_loop(
+#     north_1: np.ndarray, east_1: np.ndarray, north_2: np.ndarray, east_2: np.ndarray, out: np.ndarray
+# ) -> None:
+#     # Fuses subtract, square, accumulate and sqrt into a single pass without temporary arrays
+#     for i in prange(north_1.size):
+#         for j in range(north_2.size):
+#             d_north = north_1[i] - north_2[j]
+#             d_east = east_1[i] - east_2[j]
+#             out[i, j] = math.sqrt(d_north * d_north + d_east * d_east)
+#
+#
+# # Fills `out` with the euclidian distances of all location pairs: sqrt((x_2 - x_1)^2 + (y_2 - y_1)^2)
+# pairwise_euclidian_cost = (
+#     njit(cache=True, fastmath=True, parallel=True)(_pairwise_cost_loop) if USE_NUMBA else _pairwise_cost_numpy
+# )
+
+# Example solution bipartite graph matching
+# try:
+#     import lap
+#
+#     USE_LAPJV = True
+# except ImportError:
+#     USE_LAPJV = False
+#
+#
+# def solve_assignment(cost_matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+#     """
+#     Solves the linear assignment problem and returns the matched row and column indices.
+#     The 2x2 case is solved in closed form, larger problems use the Jonker-Volgenant solver from `lap` if installed,
+#     otherwise fall back to scipy's Hungarian method.
+#     """
+#     if cost_matrix.shape == (2, 2):
+#         # Only two possible assignments, compare their total costs directly
+#         if cost_matrix[0, 0] + cost_matrix[1, 1] <= cost_matrix[0, 1] + cost_matrix[1, 0]:
+#             return np.arange(2), np.array([0, 1])
+#         return np.arange(2), np.array([1, 0])
+#     if USE_LAPJV:
+#         _, x, _ = lap.lapjv(cost_matrix, extend_cost=True)
+#         row_idx = np.flatnonzero(x >= 0)
+#         return row_idx, x[row_idx]
+#     return linear_sum_assignment(cost_matrix)
 
 # Example solution match and fuse
 # def match_and_fuse_identified_objects(
@@ -25,39 +96,33 @@
 #     output a list of fused identified objects.
 #     """
 #
-#     def distance_metric(object1: IdentifiedObject, object2: IdentifiedObject) -> Meters:
-#         # Euclidian distance: sqrt((x_2 - x_1)^2 + (y_2 - y_1)^2)
-#         euclidian_distance = math.sqrt(
-#             (object2.object_location_north_east.north - object1.object_location_north_east.north) ** 2
-#             + (object2.object_location_north_east.east - object1.object_location_north_east.east) ** 2
-#         )
-#         return Meters(euclidian_distance)
-#
-#     # Generate cost matrix
-#     cost_matrix = np.zeros((2, 2))
 #     sensor_1_objects = sensor_object_mapping[1]
 #     sensor_2_objects = sensor_object_mapping[2]
-#     # rows = sensor 1, columns = sensor2
-#     for row_idx, o1 in enumerate(sensor_1_objects):
-#         for col_idx, o2 in enumerate(sensor_2_objects):
-#             cost_matrix[row_idx, col_idx] = distance_metric(o1, o2)
+#     north_1, east_1 = locations_to_soa(sensor_1_objects)
+#     north_2, east_2 = locations_to_soa(sensor_2_objects)
+#
+#     # Generate cost matrix of pairwise euclidian distances, rows = sensor 1, columns = sensor 2
+#     cost_matrix = np.empty((len(sensor_1_objects), len(sensor_2_objects)))
+#     pairwise_euclidian_cost(north_1, east_1, north_2, east_2, cost_matrix)
 #
 #     # Bipartite graph matching
-#     row_idx, col_idx = linear_sum_assignment(cost_matrix)
+#     row_idx, col_idx = solve_assignment(cost_matrix)
+#
+#     # Re-calculate the fused locations as the average from both perspectives
+#     fused_north = 0.5 * (north_1[row_idx] + north_2[col_idx])
+#     fused_east = 0.5 * (east_1[row_idx] + east_2[col_idx])
+#
 #     fused_objects = []
-#     for row, col in zip(row_idx, col_idx, strict=True):
+#     for i, (row, col) in enumerate(zip(row_idx, col_idx, strict=True)):
 #         s1_object = sensor_1_objects[row]
-#         s2_object = sensor_2_objects[col]
-#         logger.info(
-#             f"Fused sensor 1 identified object at location {s1_object.object_location_north_east} and "
-#             f"sensor 2 identified object at location {s2_object.object_location_north_east}"
-#         )
-#
-#         # Re-calculate the fused location as the average from both perspectives
-#         fused_north = (s1_object.object_location_north_east.north + s2_object.object_location_north_east.north) / 2.0
-#         fused_east = (s1_object.object_location_north_east.east + s2_object.object_location_north_east.east) / 2.0
-#         fused_location = LocationNE(north=fused_north, east=fused_east)
-#         s1_object.object_location_north_east = fused_location
+#         if logger.isEnabledFor(logging.INFO):
+#             s2_object = sensor_2_objects[col]
+#             logger.info(
+#                 f"Fused sensor 1 identified object at location {s1_object.object_location_north_east} and "
+#                 f"sensor 2 identified object at location {s2_object.object_location_north_east} "
+#                 f"with distance {distance_metric(s1_object, s2_object):.2f}m"
+#             )
+#         s1_object.object_location_north_east = LocationNE(north=float(fused_north[i]), east=float(fused_east[i]))
 #         fused_objects.append(s1_object)
 #
 #     return fused_objects
\ No newline at end of file
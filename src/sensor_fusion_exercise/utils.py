@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 from nptyping import Float, NDArray, Shape
 
 Degrees = float
@@ -13,7 +14,7 @@ Image = NDArray[Shape["H, W, 3"], Float]  # height x width x channel
 OBJECT_PRIORS_WIDTH: dict[str, Meters] = {"tank": 7.0, "car": 3.5}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LocationNE:
     """Location in north-east w.r.t. a flat surface, ie elevation (z-axis) is neglected."""
 
@@ -23,3 +24,10 @@ class LocationNE:
     @staticmethod
     def null() -> LocationNE:
         return LocationNE(north=0, east=0)
+
+
+def north_east_arrays(locations: list[LocationNE]) -> tuple[NDArray[Shape["N"], Float], NDArray[Shape["N"], Float]]:
+    """Splits north-east locations into one array of north and one of east coordinates in a single pass."""
+    north_east = np.array([(location.north, location.east) for location in locations], dtype=np.float64)
+    norths, easts = north_east.reshape(-1, 2).T  # reshape keeps the (0, 2) shape for empty inputs
+    return norths, easts
@@ -0,0 +1,139 @@
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import pytest
+
+from sensor_fusion_exercise.fusion_station import MIN_SENSORS_FOR_EXECUTOR, FusionStation
+from sensor_fusion_exercise.object_recognition import BoundingBox, IdentifiedObject, MockObjectRecognition
+from sensor_fusion_exercise.sensor import CameraConfig, Frame, MockCamera, Sensor
+from sensor_fusion_exercise.utils import LocationNE, Meters, SensorId
+
+CAMERA_CFG = CameraConfig(image_width=1920, image_height=1080, fov_horizontal=40.0, fov_vertical=22.5)
+
+
+@pytest.fixture
+def agg_backend() -> Iterator[None]:
+    backend = plt.get_backend()
+    plt.switch_backend("agg")
+    yield
+    plt.close("all")
+    plt.switch_backend(backend)
+
+
+class _CountingThreadPoolExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=4)
+        self.num_submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:  # type: ignore[no-untyped-def]
+        self.num_submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def _distance_from_bbox_width(identified_object: IdentifiedObject, _frame: Frame) -> Meters:
+    return 10_000.0 / identified_object.bounding_box.width
+
+
+def _fusion_station(num_sensors: int, executor: ThreadPoolExecutor | None) -> FusionStation:
+    sensor_array: list[Sensor[Frame]] = [
+        MockCamera(
+            config=CAMERA_CFG,
+            asset_location_ne=LocationNE(north=0.0, east=25.0 * sensor_id),
+            bearing_angle=10.0 * sensor_id,
+            sensor_id=sensor_id,
+        )
+        for sensor_id in range(num_sensors)
+    ]
+    ground_truth_objects = {
+        sensor.sensor_id: [
+            IdentifiedObject(
+                bounding_box=BoundingBox(800 + 20 * sensor.sensor_id, 500, 180, 100),
+                class_name="tank",
+                object_location_north_east=LocationNE.null(),
+            ),
+            IdentifiedObject(
+                bounding_box=BoundingBox(1200, 500, 60 + 5 * sensor.sensor_id, 100),
+                class_name="car",
+                object_location_north_east=LocationNE.null(),
+            ),
+        ]
+        for sensor in sensor_array
+    }
+    object_recognition = MockObjectRecognition(ground_truth_objects, _distance_from_bbox_width)
+    # Fusion keeps the objects of the first sensor, which is enough to exercise the visualisation
+    return FusionStation(sensor_array, object_recognition, lambda mapping: mapping[0], executor=executor)
+
+
+def _locations(sensor_object_mapping: dict[SensorId, list[IdentifiedObject]]) -> dict[SensorId, list[tuple]]:
+    return {
+        sensor_id: [
+            (identified_object.class_name, identified_object.object_location_north_east)
+            for identified_object in identified_objects
+        ]
+        for sensor_id, identified_objects in sensor_object_mapping.items()
+    }
+
+
+@pytest.mark.parametrize("num_sensors", [MIN_SENSORS_FOR_EXECUTOR, 5])
+def test_next_tick_with_executor_matches_serial(num_sensors: int) -> None:
+    expected = _locations(_fusion_station(num_sensors, executor=None)._next_tick())
+
+    with _CountingThreadPoolExecutor() as executor:
+        sensor_object_mapping = _fusion_station(num_sensors, executor=executor)._next_tick()
+
+    assert executor.num_submitted == num_sensors
+    assert list(sensor_object_mapping) == list(range(num_sensors))
+    assert _locations(sensor_object_mapping) == expected
+
+
+def test_next_tick_falls_back_to_serial_for_few_sensors() -> None:
+    expected = _locations(_fusion_station(2, executor=None)._next_tick())
+
+    with _CountingThreadPoolExecutor() as executor:
+        sensor_object_mapping = _fusion_station(2, executor=executor)._next_tick()
+
+    assert executor.num_submitted == 0
+    assert _locations(sensor_object_mapping) == expected
+
+
+def test_execute_with_fusion_reuses_figure(agg_backend: None) -> None:
+    fusion_station = _fusion_station(2, executor=None)
+
+    fusion_station.execute_with_fusion()
+    figure, ax = fusion_station._figures["fused"]
+    fusion_station.execute_with_fusion()
+
+    assert fusion_station._figures["fused"][0].number == figure.number
+    assert fusion_station._figures["fused"][1] is ax
+    # 2 sensors and 2 fused objects from the latest tick only
+    assert len(ax.texts) == 4
+    assert len(ax.collections) == 1
+
+
+def test_fused_and_not_fused_use_separate_figures(agg_backend: None) -> None:
+    fusion_station = _fusion_station(2, executor=None)
+
+    fusion_station.execute_without_fusion()
+    fusion_station.execute_with_fusion()
+
+    not_fused_figure, not_fused_ax = fusion_station._figures["not_fused"]
+    fused_figure, _ = fusion_station._figures["fused"]
+    assert not_fused_figure.number != fused_figure.number
+    assert plt.fignum_exists(not_fused_figure.number)
+    # 2 sensors and 2 objects per sensor are still drawn in the not fused picture
+    assert len(not_fused_ax.texts) == 6
+
+
+def test_closed_figure_is_recreated(agg_backend: None) -> None:
+    fusion_station = _fusion_station(2, executor=None)
+
+    fusion_station.execute_with_fusion()
+    figure, _ = fusion_station._figures["fused"]
+    plt.close(figure)
+    fusion_station.execute_with_fusion()
+
+    new_figure, new_ax = fusion_station._figures["fused"]
+    assert new_figure is not figure
+    assert plt.fignum_exists(new_figure.number)
+    assert len(new_ax.texts) == 4
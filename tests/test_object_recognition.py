@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pytest
+
+from sensor_fusion_exercise.object_recognition import (
+    BoundingBox,
+    IdentifiedObject,
+    MockObjectRecognition,
+    locations_to_soa,
+)
+from sensor_fusion_exercise.sensor import CameraConfig, Frame, MockCamera
+from sensor_fusion_exercise.utils import LocationNE, Meters
+
+CAMERA_CFG = CameraConfig(image_width=1920, image_height=1080, fov_horizontal=40.0, fov_vertical=22.5)
+DISTANCES: dict[str, Meters] = {"tank": 100.0, "car": 140.0}
+
+
+def _distance_from_class(identified_object: IdentifiedObject, _frame: Frame) -> Meters:
+    return DISTANCES[identified_object.class_name]
+
+
+def _expected_location(sensor: MockCamera, bounding_box: BoundingBox, distance: Meters) -> LocationNE:
+    center_x = bounding_box.x + bounding_box.width / 2
+    bearing = sensor.bearing + center_x / CAMERA_CFG.image_width * CAMERA_CFG.fov_horizontal
+    bearing -= CAMERA_CFG.fov_horizontal / 2
+    return LocationNE(
+        north=sensor.location_north_east.north + distance * math.cos(math.radians(bearing)),
+        east=sensor.location_north_east.east + distance * math.sin(math.radians(bearing)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("location", "bearing"),
+    [
+        (LocationNE(north=0.0, east=0.0), 0.0),
+        (LocationNE(north=0.0, east=50.0), 26.6),
+        (LocationNE(north=-20.0, east=10.0), 135.0),
+        (LocationNE(north=35.5, east=-12.25), 290.0),
+    ],
+)
+def test_identify_and_localise_matches_bearing_and_distance(location: LocationNE, bearing: float) -> None:
+    sensor = MockCamera(config=CAMERA_CFG, asset_location_ne=location, bearing_angle=bearing, sensor_id=1)
+    bounding_boxes = {"tank": BoundingBox(880, 500, 180, 100), "car": BoundingBox(10, 500, 60, 100)}
+    ground_truth_objects = {
+        1: [
+            IdentifiedObject(
+                bounding_box=bounding_box, class_name=class_name, object_location_north_east=LocationNE.null()
+            )
+            for class_name, bounding_box in bounding_boxes.items()
+        ]
+    }
+    object_recognition = MockObjectRecognition(ground_truth_objects, _distance_from_class)
+
+    identified_objects = object_recognition.identify_and_localise(sensor.next_tick(), sensor)
+
+    assert [identified_object.class_name for identified_object in identified_objects] == ["tank", "car"]
+    for identified_object in identified_objects:
+        expected = _expected_location(
+            sensor, bounding_boxes[identified_object.class_name], DISTANCES[identified_object.class_name]
+        )
+        assert identified_object.object_location_north_east.north == pytest.approx(expected.north, abs=1e-9)
+        assert identified_object.object_location_north_east.east == pytest.approx(expected.east, abs=1e-9)
+
+
+def test_locations_to_soa_empty() -> None:
+    norths, easts = locations_to_soa([])
+
+    for array in (norths, easts):
+        assert array.shape == (0,)
+        assert array.dtype == np.float64
+
+
+def test_locations_to_soa_keeps_order() -> None:
+    identified_objects = [
+        IdentifiedObject(
+            bounding_box=BoundingBox(0, 0, 10, 10),
+            class_name=class_name,
+            object_location_north_east=LocationNE(north=north, east=east),
+        )
+        for class_name, north, east in [("tank", 95.5, 48.25), ("car", 146.75, 64.0)]
+    ]
+
+    norths, easts = locations_to_soa(identified_objects)
+
+    np.testing.assert_array_equal(norths, [95.5, 146.75])
+    np.testing.assert_array_equal(easts, [48.25, 64.0])
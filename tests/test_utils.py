@@ -0,0 +1,22 @@
+import numpy as np
+
+from sensor_fusion_exercise.utils import LocationNE, north_east_arrays
+
+
+def test_north_east_arrays_empty() -> None:
+    norths, easts = north_east_arrays([])
+
+    for array in (norths, easts):
+        assert array.shape == (0,)
+        assert array.dtype == np.float64
+
+
+def test_north_east_arrays_keeps_order() -> None:
+    locations = [LocationNE(north=1.5, east=-2.0), LocationNE(north=3.0, east=4.25), LocationNE(north=0, east=7)]
+
+    norths, easts = north_east_arrays(locations)
+
+    assert norths.dtype == np.float64
+    assert easts.dtype == np.float64
+    np.testing.assert_array_equal(norths, [1.5, 3.0, 0.0])
+    np.testing.assert_array_equal(easts, [-2.0, 4.25, 7.0])